@@ -4,6 +4,8 @@ from uuid import uuid4, UUID
 
 from app.domain.entities.user import User
 from app.domain.entities.refresh_token import RefreshToken
+from app.domain.entities.auth_event import AuthEvent, AuthEventType
+from app.domain.interfaces.audit_log import AuditLog
 from app.domain.interfaces.user_repo import UserRepository
 from app.domain.interfaces.refresh_token_repo import RefreshTokenRepository
 from app.infrastructure.security import PasswordHasher, TokenGenerator
@@ -26,12 +28,14 @@ class AuthService:
         password_hasher: PasswordHasher,
         jwt_service: JWTService,
         token_generator: TokenGenerator,
+        audit_log: AuditLog,
     ):
         self.user_repository = user_repository
         self.refresh_token_repository = refresh_token_repository
         self.password_hasher = password_hasher
         self.jwt_service = jwt_service
         self.token_generator = token_generator
+        self.audit_log = audit_log
 
     async def register_user(self, email: str, password: str) -> User:
         existing_user = await self.user_repository.get_by_email(email)
@@ -51,6 +55,8 @@ class AuthService:
 
         await self.user_repository.save(user)
 
+        self._record_event(user.id, AuthEventType.REGISTER)
+
         return user
 
     async def login_user(self, email: str, password: str) -> AuthTokens:
@@ -74,6 +80,8 @@ class AuthService:
 
         await self.refresh_token_repository.save(refresh_entity)
 
+        self._record_event(user.id, AuthEventType.LOGIN)
+
         return AuthTokens(
             access_token=access_token,
             refresh_token=refresh_token,
@@ -93,12 +101,23 @@ class AuthService:
 
         return user
 
+    def _record_event(self, user_id: UUID, event_type: AuthEventType) -> None:
+        self.audit_log.record(
+            AuthEvent(
+                id=uuid4(),
+                user_id=user_id,
+                event_type=event_type,
+                created_at=datetime.now(timezone.utc),
+            )
+        )
+
     async def logout(self, refresh_token: str, user_id: UUID) -> None:
         tokens = await self.refresh_token_repository.get_active_by_user_id(user_id)
 
         for token in tokens:
             if self.password_hasher.verify(refresh_token, token.token_hash):
                 await self.refresh_token_repository.revoke(token)
+                self._record_event(user_id, AuthEventType.LOGOUT)
                 return
 
         raise ValueError("Invalid refresh token")
\ No newline at end of file
@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+from datetime import datetime
+from enum import StrEnum
+from uuid import UUID
+
+
+class AuthEventType(StrEnum):
+    REGISTER = "register"
+    LOGIN = "login"
+    LOGOUT = "logout"
+
+
+@dataclass
+class AuthEvent:
+    id: UUID
+    user_id: UUID
+    event_type: AuthEventType
+    created_at: datetime
@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional
+
+
+@dataclass
+class Instrument:
+    instrument_token: int
+    exchange_token: int
+    tradingsymbol: str
+    name: str
+    exchange: str
+    segment: str
+    instrument_type: str
+    expiry: Optional[date]
+    strike: float
+    tick_size: float
+    lot_size: int
@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+from app.domain.entities.auth_event import AuthEvent
+
+
+class AuditLog(ABC):
+
+    @abstractmethod
+    def record(self, event: AuthEvent) -> None:
+        """Enqueue an event without blocking the caller."""
+        pass
@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+from typing import List
+from uuid import UUID
+from app.domain.entities.auth_event import AuthEvent
+
+
+class AuthEventRepository(ABC):
+
+    @abstractmethod
+    async def save_many(self, events: List[AuthEvent]) -> None:
+        pass
+
+    @abstractmethod
+    async def get_recent_by_user_id(self, user_id: UUID, limit: int) -> List[AuthEvent]:
+        pass
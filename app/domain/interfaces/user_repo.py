@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from uuid import UUID
-from typing import Optional
+from typing import AsyncIterator, Optional
 from app.domain.entities.user import User
 
 
@@ -16,4 +16,13 @@ class UserRepository(ABC):
 
     @abstractmethod
     async def save(self, user: User) -> None:
+        pass
+
+    @abstractmethod
+    def stream_all(
+        self,
+        after_id: Optional[UUID] = None,
+        prefetch: int = 1000,
+    ) -> AsyncIterator[User]:
+        """Yield users ordered by id, starting after `after_id` if given."""
         pass
\ No newline at end of file
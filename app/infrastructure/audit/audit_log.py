@@ -0,0 +1,100 @@
+import asyncio
+import logging
+from typing import List
+
+from app.domain.entities.auth_event import AuthEvent
+from app.domain.interfaces.audit_log import AuditLog
+from app.domain.interfaces.auth_event_repo import AuthEventRepository
+from app.infrastructure.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class QueuedAuditLog(AuditLog):
+    """
+    Buffers auth events in a bounded in-process queue. A background writer
+    drains it in batches into the repository; when the queue is full new
+    events are dropped and counted instead of blocking the request path.
+    """
+
+    def __init__(self, max_size: int, batch_size: int, flush_interval: float):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped_events = 0
+        self.written_events = 0
+        self.failed_events = 0
+
+        self._queue: asyncio.Queue[AuthEvent] = asyncio.Queue(maxsize=max_size)
+        self._repository: AuthEventRepository | None = None
+        self._writer: asyncio.Task | None = None
+        self._closing = False
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    def record(self, event: AuthEvent) -> None:
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.dropped_events += 1
+
+    def start(self, repository: AuthEventRepository) -> None:
+        self._repository = repository
+        self._closing = False
+        self._writer = asyncio.create_task(self._run(repository))
+
+    async def stop(self) -> None:
+        self._closing = True
+
+        if self._writer:
+            await self._writer
+            self._writer = None
+
+        if self._repository is None:
+            return
+
+        while not self._queue.empty():
+            await self._flush(self._repository, self._drain())
+
+    async def _run(self, repository: AuthEventRepository) -> None:
+        while not self._closing:
+            batch = await self._collect()
+
+            if batch:
+                await self._flush(repository, batch)
+
+    async def _collect(self) -> List[AuthEvent]:
+        try:
+            first = await asyncio.wait_for(self._queue.get(), self.flush_interval)
+        except asyncio.TimeoutError:
+            return []
+
+        return [first] + self._drain(self.batch_size - 1)
+
+    def _drain(self, limit: int | None = None) -> List[AuthEvent]:
+        limit = self.batch_size if limit is None else limit
+        batch: List[AuthEvent] = []
+
+        while len(batch) < limit:
+            try:
+                batch.append(self._queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+
+        return batch
+
+    async def _flush(self, repository: AuthEventRepository, batch: List[AuthEvent]) -> None:
+        try:
+            await repository.save_many(batch)
+            self.written_events += len(batch)
+        except Exception:
+            self.failed_events += len(batch)
+            logger.exception("Failed to write %d audit events", len(batch))
+
+
+audit_log = QueuedAuditLog(
+    max_size=settings.audit_queue_size,
+    batch_size=settings.audit_batch_size,
+    flush_interval=settings.audit_flush_interval_seconds,
+)
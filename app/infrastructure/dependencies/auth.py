@@ -1,10 +1,12 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, Header, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from uuid import UUID
+import secrets
 
 from app.domain.entities.user import User
 from app.infrastructure.dependencies.services import get_auth_service
 from app.application.service.auth_service import AuthService
+from app.infrastructure.settings import settings
 
 security = HTTPBearer()
 
@@ -33,4 +35,17 @@ async def get_current_user(
             detail="User not found or inactive",
         )
 
-    return user
\ No newline at end of file
+    return user
+
+
+async def require_admin(
+    x_admin_key: str = Header(default=""),
+) -> None:
+
+    if not settings.admin_api_key or not secrets.compare_digest(
+        x_admin_key, settings.admin_api_key
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required",
+        )
\ No newline at end of file
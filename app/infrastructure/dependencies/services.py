@@ -1,9 +1,12 @@
 from app.application.service.auth_service import AuthService
 from app.infrastructure.postgres.user_repo import PostgresUserRepository
 from app.infrastructure.postgres.refresh_token_repo import PostgresRefreshTokenRepository
+from app.infrastructure.postgres.auth_event_repo import PostgresAuthEventRepository
+from app.infrastructure.audit.audit_log import QueuedAuditLog, audit_log
 from app.infrastructure.security import PasswordHasher, TokenGenerator
 from app.infrastructure.jwt_service import JWTService
 from app.infrastructure.database import connection
+from app.infrastructure.instruments.registry import InstrumentRegistry, instrument_registry
 
 
 def get_auth_service() -> AuthService:
@@ -20,4 +23,21 @@ def get_auth_service() -> AuthService:
         password_hasher=password_hasher,
         jwt_service=jwt_service,
         token_generator=token_generator,
-    )
\ No newline at end of file
+        audit_log=audit_log,
+    )
+
+
+def get_auth_event_repository() -> PostgresAuthEventRepository:
+    return PostgresAuthEventRepository(connection.db_pool)
+
+
+def get_audit_log() -> QueuedAuditLog:
+    return audit_log
+
+
+def get_instrument_registry() -> InstrumentRegistry:
+    return instrument_registry
+
+
+def get_user_repository() -> PostgresUserRepository:
+    return PostgresUserRepository(connection.db_pool)
\ No newline at end of file
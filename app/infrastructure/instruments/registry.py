@@ -0,0 +1,265 @@
+import asyncio
+import logging
+import sys
+from array import array
+from bisect import bisect_left
+from datetime import date, datetime, timedelta, timezone
+from typing import Iterable, List, Optional
+
+from kiteconnect import KiteConnect
+
+from app.domain.entities.instrument import Instrument
+from app.infrastructure.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class _Interner:
+    """Maps repeated strings to small integer codes backed by a single table."""
+
+    def __init__(self):
+        self.values: List[str] = []
+        self._codes: dict[str, int] = {}
+
+    def code(self, value: str) -> int:
+        code = self._codes.get(value)
+
+        if code is None:
+            code = len(self.values)
+            self.values.append(sys.intern(value))
+            self._codes[value] = code
+
+        return code
+
+
+class InstrumentIndex:
+    """
+    Immutable, column-oriented snapshot of the instrument master.
+
+    Each instrument is a row number into typed arrays; categorical text
+    columns hold codes into interned string tables. Symbol lookup goes
+    through sorted row-number prefix indexes, one overall and one per
+    exchange, and a token-to-row hash index.
+    """
+
+    def __init__(self, rows: Iterable[dict]):
+        symbols = _Interner()
+        names = _Interner()
+        exchanges = _Interner()
+        segments = _Interner()
+        instrument_types = _Interner()
+
+        self.instrument_tokens = array("q")
+        self.exchange_tokens = array("q")
+        self.symbol_codes = array("I")
+        self.name_codes = array("I")
+        self.exchange_codes = array("H")
+        self.segment_codes = array("H")
+        self.instrument_type_codes = array("H")
+        self.expiry_ordinals = array("I")
+        self.strikes = array("d")
+        self.tick_sizes = array("d")
+        self.lot_sizes = array("i")
+
+        for row in rows:
+            expiry = row.get("expiry")
+
+            self.instrument_tokens.append(int(row["instrument_token"]))
+            self.exchange_tokens.append(int(row.get("exchange_token") or 0))
+            self.symbol_codes.append(symbols.code(row["tradingsymbol"]))
+            self.name_codes.append(names.code(row.get("name") or ""))
+            self.exchange_codes.append(exchanges.code(row["exchange"]))
+            self.segment_codes.append(segments.code(row.get("segment") or ""))
+            self.instrument_type_codes.append(
+                instrument_types.code(row.get("instrument_type") or "")
+            )
+            self.expiry_ordinals.append(
+                expiry.toordinal() if isinstance(expiry, date) else 0
+            )
+            self.strikes.append(float(row.get("strike") or 0.0))
+            self.tick_sizes.append(float(row.get("tick_size") or 0.0))
+            self.lot_sizes.append(int(row.get("lot_size") or 0))
+
+        self.symbols = tuple(symbols.values)
+        self.names = tuple(names.values)
+        self.exchanges = tuple(exchanges.values)
+        self.segments = tuple(segments.values)
+        self.instrument_types = tuple(instrument_types.values)
+
+        self._upper_symbols = tuple(sys.intern(symbol.upper()) for symbol in self.symbols)
+
+        order = sorted(range(len(self.symbol_codes)), key=self._sort_key)
+        rows_by_exchange = {code: array("I") for code in range(len(self.exchanges))}
+
+        for row in order:
+            rows_by_exchange[self.exchange_codes[row]].append(row)
+
+        self._sorted_rows = array("I", order)
+        self._sorted_rows_by_exchange = rows_by_exchange
+        self._row_by_token = {
+            token: row for row, token in enumerate(self.instrument_tokens)
+        }
+
+    def __len__(self) -> int:
+        return len(self.instrument_tokens)
+
+    def _sort_key(self, row: int) -> str:
+        return self._upper_symbols[self.symbol_codes[row]]
+
+    def get_by_token(self, instrument_token: int) -> Optional[Instrument]:
+        row = self._row_by_token.get(instrument_token)
+
+        if row is None:
+            return None
+
+        return self._instrument(row)
+
+    def search(
+        self,
+        prefix: str,
+        limit: int = 20,
+        exchange: Optional[str] = None,
+    ) -> List[Instrument]:
+        prefix = prefix.upper()
+        sorted_rows = self._sorted_rows
+
+        if exchange is not None:
+            try:
+                exchange_code = self.exchanges.index(exchange.upper())
+            except ValueError:
+                return []
+
+            sorted_rows = self._sorted_rows_by_exchange[exchange_code]
+
+        results: List[Instrument] = []
+        position = bisect_left(sorted_rows, prefix, key=self._sort_key)
+
+        while position < len(sorted_rows) and len(results) < limit:
+            row = sorted_rows[position]
+
+            if not self._sort_key(row).startswith(prefix):
+                break
+
+            results.append(self._instrument(row))
+            position += 1
+
+        return results
+
+    def _instrument(self, row: int) -> Instrument:
+        expiry_ordinal = self.expiry_ordinals[row]
+
+        return Instrument(
+            instrument_token=self.instrument_tokens[row],
+            exchange_token=self.exchange_tokens[row],
+            tradingsymbol=self.symbols[self.symbol_codes[row]],
+            name=self.names[self.name_codes[row]],
+            exchange=self.exchanges[self.exchange_codes[row]],
+            segment=self.segments[self.segment_codes[row]],
+            instrument_type=self.instrument_types[self.instrument_type_codes[row]],
+            expiry=date.fromordinal(expiry_ordinal) if expiry_ordinal else None,
+            strike=self.strikes[row],
+            tick_size=self.tick_sizes[row],
+            lot_size=self.lot_sizes[row],
+        )
+
+
+class InstrumentRegistry:
+    """
+    Holds the current InstrumentIndex. A reload builds a complete new index
+    off the event loop and swaps it in with a single reference assignment,
+    so readers always see either the old or the new snapshot.
+    """
+
+    def __init__(self, index: Optional[InstrumentIndex] = None):
+        self.index = index if index is not None else InstrumentIndex([])
+        self.loaded_at: Optional[datetime] = None
+
+    async def reload(self) -> None:
+        index = await asyncio.to_thread(self._build_index)
+
+        self.index = index
+        self.loaded_at = datetime.now(timezone.utc)
+
+    def _build_index(self) -> InstrumentIndex:
+        kite = KiteConnect(api_key=settings.kite_api_key)
+        return InstrumentIndex(kite.instruments())
+
+    def search(
+        self,
+        prefix: str,
+        limit: int = 20,
+        exchange: Optional[str] = None,
+    ) -> List[Instrument]:
+        return self.index.search(prefix, limit=limit, exchange=exchange)
+
+    def get_by_token(self, instrument_token: int) -> Optional[Instrument]:
+        return self.index.get_by_token(instrument_token)
+
+
+instrument_registry = InstrumentRegistry()
+
+_refresh_task: asyncio.Task | None = None
+
+
+def _seconds_until_next_refresh() -> float:
+    now = datetime.now(timezone.utc)
+    next_run = now.replace(
+        hour=settings.instruments_refresh_hour_utc,
+        minute=settings.instruments_refresh_minute_utc,
+        second=0,
+        microsecond=0,
+    )
+
+    if next_run <= now:
+        next_run += timedelta(days=1)
+
+    return (next_run - now).total_seconds()
+
+
+async def _load_with_retry() -> None:
+    delay = settings.instruments_retry_initial_seconds
+
+    while instrument_registry.loaded_at is None:
+        try:
+            await instrument_registry.reload()
+        except Exception:
+            logger.exception("Instrument master load failed, retrying in %.0fs", delay)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, settings.instruments_retry_max_seconds)
+
+
+async def _refresh_daily() -> None:
+    await _load_with_retry()
+
+    while True:
+        await asyncio.sleep(_seconds_until_next_refresh())
+
+        try:
+            await instrument_registry.reload()
+        except Exception:
+            logger.exception("Instrument master reload failed, keeping previous snapshot")
+
+
+async def load_instruments() -> None:
+    global _refresh_task
+
+    try:
+        await instrument_registry.reload()
+    except Exception:
+        logger.exception("Initial instrument master load failed, retrying in background")
+
+    _refresh_task = asyncio.create_task(_refresh_daily())
+
+
+async def stop_instruments_refresh() -> None:
+    global _refresh_task
+
+    if _refresh_task:
+        _refresh_task.cancel()
+
+        try:
+            await _refresh_task
+        except asyncio.CancelledError:
+            pass
+
+        _refresh_task = None
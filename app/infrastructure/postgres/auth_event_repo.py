@@ -0,0 +1,45 @@
+from uuid import UUID
+from typing import List
+from app.domain.entities.auth_event import AuthEvent, AuthEventType
+from app.domain.interfaces.auth_event_repo import AuthEventRepository
+
+
+class PostgresAuthEventRepository(AuthEventRepository):
+
+    def __init__(self, db):
+        self.db = db
+
+    async def save_many(self, events: List[AuthEvent]) -> None:
+        records = [
+            (event.id, event.user_id, str(event.event_type), event.created_at)
+            for event in events
+        ]
+
+        async with self.db.acquire() as conn:
+            await conn.copy_records_to_table(
+                "auth_events",
+                records=records,
+                columns=["id", "user_id", "event_type", "created_at"],
+            )
+
+    async def get_recent_by_user_id(self, user_id: UUID, limit: int) -> List[AuthEvent]:
+        query = """
+            SELECT id, user_id, event_type, created_at
+            FROM auth_events
+            WHERE user_id = $1
+            ORDER BY created_at DESC
+            LIMIT $2;
+        """
+
+        async with self.db.acquire() as conn:
+            rows = await conn.fetch(query, user_id, limit)
+
+        return [
+            AuthEvent(
+                id=row["id"],
+                user_id=row["user_id"],
+                event_type=AuthEventType(row["event_type"]),
+                created_at=row["created_at"],
+            )
+            for row in rows
+        ]
@@ -1,5 +1,5 @@
 from uuid import UUID
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 from app.domain.entities.user import User
 from app.domain.interfaces.user_repo import UserRepository
@@ -70,4 +70,36 @@ class PostgresUserRepository(UserRepository):
                 user.password_hash,
                 user.is_active,
                 user.created_at,
-            )
\ No newline at end of file
+            )
+
+    async def stream_all(
+        self,
+        after_id: Optional[UUID] = None,
+        prefetch: int = 1000,
+    ) -> AsyncIterator[User]:
+        if after_id is None:
+            query = """
+                SELECT id, email, password_hash, is_active, created_at
+                FROM users
+                ORDER BY id;
+            """
+            args = ()
+        else:
+            query = """
+                SELECT id, email, password_hash, is_active, created_at
+                FROM users
+                WHERE id > $1
+                ORDER BY id;
+            """
+            args = (after_id,)
+
+        async with self.db.acquire() as conn:
+            async with conn.transaction(readonly=True):
+                async for row in conn.cursor(query, *args, prefetch=prefetch):
+                    yield User(
+                        id=row["id"],
+                        email=row["email"],
+                        password_hash=row["password_hash"],
+                        is_active=row["is_active"],
+                        created_at=row["created_at"],
+                    )
\ No newline at end of file
@@ -15,6 +15,23 @@ class Settings(BaseSettings):
     postgres_host: str = "localhost"
     postgres_port: int = 5432
 
+    #kite
+    kite_api_key: str = ""
+    instruments_refresh_hour_utc: int = 3
+    instruments_refresh_minute_utc: int = 0
+    instruments_retry_initial_seconds: float = 5.0
+    instruments_retry_max_seconds: float = 300.0
+
+    #audit
+    audit_queue_size: int = 10000
+    audit_batch_size: int = 500
+    audit_flush_interval_seconds: float = 1.0
+
+    #admin
+    admin_api_key: str = ""
+    user_export_prefetch: int = 1000
+    user_export_chunk_rows: int = 500
+
     @property
     def database_url(self) -> str:
         return (
@@ -2,19 +2,33 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
+from app.infrastructure.database import connection
 from app.infrastructure.database.connection import (
     connect_to_db,
     close_db_connection,
 )
+from app.infrastructure.audit.audit_log import audit_log
+from app.infrastructure.postgres.auth_event_repo import PostgresAuthEventRepository
+from app.infrastructure.instruments.registry import (
+    load_instruments,
+    stop_instruments_refresh,
+)
 
 from app.presentation.api.auth_router import router as auth_router
+from app.presentation.api.instrument_router import router as instrument_router
+from app.presentation.api.audit_router import router as audit_router
+from app.presentation.api.admin_router import router as admin_router
 
 @asynccontextmanager
 async def lifespan(application: FastAPI):
     # Startup
     await connect_to_db()
+    audit_log.start(PostgresAuthEventRepository(connection.db_pool))
+    await load_instruments()
     yield
     # Shutdown
+    await stop_instruments_refresh()
+    await audit_log.stop()
     await close_db_connection()
 
 
@@ -34,6 +48,9 @@ def create_app(use_lifespan: bool = True) -> FastAPI:
     )
 
     application.include_router(auth_router)
+    application.include_router(instrument_router)
+    application.include_router(audit_router)
+    application.include_router(admin_router)
 
     return application
 
@@ -0,0 +1,71 @@
+import base64
+import binascii
+import json
+from contextlib import aclosing
+from typing import AsyncIterator, Optional
+from uuid import UUID
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+from app.domain.interfaces.user_repo import UserRepository
+from app.infrastructure.dependencies.services import get_user_repository
+from app.infrastructure.dependencies.auth import require_admin
+from app.infrastructure.settings import settings
+
+
+router = APIRouter(prefix="/admin", tags=["Admin"], dependencies=[Depends(require_admin)])
+
+
+def encode_resume_token(user_id: UUID) -> str:
+    return base64.urlsafe_b64encode(user_id.bytes).rstrip(b"=").decode()
+
+
+def decode_resume_token(token: str) -> UUID:
+    padded = token + "=" * (-len(token) % 4)
+    return UUID(bytes=base64.urlsafe_b64decode(padded))
+
+
+async def _export_lines(
+    user_repository: UserRepository,
+    after_id: Optional[UUID],
+) -> AsyncIterator[bytes]:
+    lines = []
+    users = user_repository.stream_all(
+        after_id=after_id,
+        prefetch=settings.user_export_prefetch,
+    )
+
+    async with aclosing(users):
+        async for user in users:
+            lines.append(json.dumps({
+                "id": str(user.id),
+                "email": user.email,
+                "is_active": user.is_active,
+                "created_at": user.created_at.isoformat(),
+                "resume_token": encode_resume_token(user.id),
+            }))
+
+            if len(lines) >= settings.user_export_chunk_rows:
+                yield ("\n".join(lines) + "\n").encode()
+                lines = []
+
+    if lines:
+        yield ("\n".join(lines) + "\n").encode()
+
+
+@router.get("/users/export")
+async def export_users(
+    resume_token: Optional[str] = None,
+    user_repository: UserRepository = Depends(get_user_repository),
+):
+    after_id = None
+
+    if resume_token:
+        try:
+            after_id = decode_resume_token(resume_token)
+        except (binascii.Error, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid resume token")
+
+    return StreamingResponse(
+        _export_lines(user_repository, after_id),
+        media_type="application/x-ndjson",
+    )
@@ -0,0 +1,31 @@
+from typing import List
+from fastapi import APIRouter, Depends, Query
+from app.domain.entities.user import User
+from app.domain.interfaces.auth_event_repo import AuthEventRepository
+from app.infrastructure.audit.audit_log import QueuedAuditLog
+from app.presentation.schemas.audit_schemas import AuthEventResponse, AuditMetricsResponse
+from app.infrastructure.dependencies.services import get_auth_event_repository, get_audit_log
+from app.infrastructure.dependencies.auth import get_current_user, require_admin
+
+
+router = APIRouter(prefix="/audit", tags=["Audit"])
+
+@router.get("/events", response_model=List[AuthEventResponse])
+async def recent_events(
+    limit: int = Query(50, ge=1, le=500),
+    current_user: User = Depends(get_current_user),
+    repository: AuthEventRepository = Depends(get_auth_event_repository),
+):
+    return await repository.get_recent_by_user_id(current_user.id, limit)
+
+
+@router.get("/metrics", response_model=AuditMetricsResponse, dependencies=[Depends(require_admin)])
+async def metrics(
+    audit_log: QueuedAuditLog = Depends(get_audit_log),
+):
+    return AuditMetricsResponse(
+        queue_depth=audit_log.queue_depth,
+        dropped_events=audit_log.dropped_events,
+        written_events=audit_log.written_events,
+        failed_events=audit_log.failed_events,
+    )
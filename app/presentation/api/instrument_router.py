@@ -0,0 +1,23 @@
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from app.infrastructure.instruments.registry import InstrumentRegistry
+from app.presentation.schemas.instrument_schemas import InstrumentResponse
+from app.infrastructure.dependencies.services import get_instrument_registry
+
+
+router = APIRouter(prefix="/instruments", tags=["Instruments"])
+
+@router.get("/search", response_model=List[InstrumentResponse])
+async def search(
+    q: str = Query(..., min_length=1),
+    exchange: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    registry: InstrumentRegistry = Depends(get_instrument_registry),
+):
+    if registry.loaded_at is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Instrument master not loaded yet",
+        )
+
+    return registry.search(q, limit=limit, exchange=exchange)
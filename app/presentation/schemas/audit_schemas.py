@@ -0,0 +1,16 @@
+from datetime import datetime
+from pydantic import BaseModel
+from uuid import UUID
+
+
+class AuthEventResponse(BaseModel):
+    id: UUID
+    event_type: str
+    created_at: datetime
+
+
+class AuditMetricsResponse(BaseModel):
+    queue_depth: int
+    dropped_events: int
+    written_events: int
+    failed_events: int
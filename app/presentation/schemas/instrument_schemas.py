@@ -0,0 +1,18 @@
+from datetime import date
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class InstrumentResponse(BaseModel):
+    instrument_token: int
+    exchange_token: int
+    tradingsymbol: str
+    name: str
+    exchange: str
+    segment: str
+    instrument_type: str
+    expiry: Optional[date]
+    strike: float
+    tick_size: float
+    lot_size: int
@@ -31,7 +31,7 @@ async def clean_db():
 
     async with pool.acquire() as conn:
         await conn.execute(
-            "TRUNCATE refresh_tokens, users RESTART IDENTITY CASCADE;"
+            "TRUNCATE auth_events, refresh_tokens, users RESTART IDENTITY CASCADE;"
         )
 
     await pool.close()
@@ -0,0 +1,58 @@
+import pytest
+
+from app.infrastructure.audit.audit_log import audit_log
+from app.infrastructure.database import connection
+from app.infrastructure.postgres.auth_event_repo import PostgresAuthEventRepository
+from app.infrastructure.settings import settings
+
+
+@pytest.mark.asyncio
+async def test_auth_events_are_written_and_queried(client):
+    audit_log.start(PostgresAuthEventRepository(connection.db_pool))
+
+    response = await client.post("/auth/register", json={
+        "email": "audit@test.com",
+        "password": "123456"
+    })
+    assert response.status_code == 201
+    user_id = response.json()["id"]
+
+    response = await client.post("/auth/login", json={
+        "email": "audit@test.com",
+        "password": "123456"
+    })
+    assert response.status_code == 200
+    tokens = response.json()
+
+    response = await client.post(
+        "/auth/logout",
+        params={"user_id": user_id},
+        json={"refresh_token": tokens["refresh_token"]},
+    )
+    assert response.status_code == 204
+
+    await audit_log.stop()
+
+    response = await client.get(
+        "/audit/events",
+        headers={"Authorization": f"Bearer {tokens['access_token']}"}
+    )
+
+    assert response.status_code == 200
+    assert [event["event_type"] for event in response.json()] == [
+        "logout",
+        "login",
+        "register",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_metrics_requires_admin_key(client, monkeypatch):
+    monkeypatch.setattr(settings, "admin_api_key", "test-admin-key")
+
+    response = await client.get("/audit/metrics")
+    assert response.status_code == 403
+
+    response = await client.get("/audit/metrics", headers={"X-Admin-Key": "test-admin-key"})
+    assert response.status_code == 200
+    assert "queue_depth" in response.json()
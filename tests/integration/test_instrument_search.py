@@ -0,0 +1,53 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from app.infrastructure.instruments.registry import InstrumentIndex, instrument_registry
+
+
+ROWS = [
+    {
+        "instrument_token": 738561,
+        "exchange_token": 2885,
+        "tradingsymbol": "RELIANCE",
+        "name": "RELIANCE INDUSTRIES",
+        "exchange": "NSE",
+        "segment": "NSE",
+        "instrument_type": "EQ",
+        "tick_size": 0.05,
+        "lot_size": 1,
+    },
+]
+
+
+@pytest.fixture
+def loaded_registry(monkeypatch):
+    monkeypatch.setattr(instrument_registry, "index", InstrumentIndex(ROWS))
+    monkeypatch.setattr(instrument_registry, "loaded_at", datetime.now(timezone.utc))
+    return instrument_registry
+
+
+@pytest.mark.asyncio
+async def test_search_returns_matches(client, loaded_registry):
+    response = await client.get("/instruments/search", params={"q": "rel"})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [row["tradingsymbol"] for row in body] == ["RELIANCE"]
+    assert body[0]["expiry"] is None
+
+
+@pytest.mark.asyncio
+async def test_search_validates_query(client, loaded_registry):
+    assert (await client.get("/instruments/search", params={"q": ""})).status_code == 422
+    assert (await client.get("/instruments/search", params={"q": "R", "limit": 0})).status_code == 422
+    assert (await client.get("/instruments/search", params={"q": "R", "limit": 101})).status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_search_unavailable_until_loaded(client, monkeypatch):
+    monkeypatch.setattr(instrument_registry, "loaded_at", None)
+
+    response = await client.get("/instruments/search", params={"q": "REL"})
+
+    assert response.status_code == 503
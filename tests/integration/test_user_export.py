@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+from app.infrastructure.settings import settings
+
+
+@pytest.fixture
+def admin_key(monkeypatch):
+    monkeypatch.setattr(settings, "admin_api_key", "test-admin-key")
+    return "test-admin-key"
+
+
+@pytest.mark.asyncio
+async def test_export_requires_admin_key(client, admin_key):
+    response = await client.get("/admin/users/export")
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_export_streams_users_and_resumes(client, admin_key):
+    for i in range(3):
+        response = await client.post("/auth/register", json={
+            "email": f"user{i}@test.com",
+            "password": "123456"
+        })
+        assert response.status_code == 201
+
+    headers = {"X-Admin-Key": admin_key}
+
+    response = await client.get("/admin/users/export", headers=headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert len(rows) == 3
+    assert [row["id"] for row in rows] == sorted(row["id"] for row in rows)
+    assert "password_hash" not in rows[0]
+
+    response = await client.get(
+        "/admin/users/export",
+        headers=headers,
+        params={"resume_token": rows[0]["resume_token"]},
+    )
+
+    resumed = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["id"] for row in resumed] == [row["id"] for row in rows[1:]]
+
+
+
+@pytest.mark.asyncio
+async def test_export_rejects_malformed_resume_token(client, admin_key):
+    response = await client.get(
+        "/admin/users/export",
+        headers={"X-Admin-Key": admin_key},
+        params={"resume_token": "not-a-token!"},
+    )
+
+    assert response.status_code == 400
@@ -0,0 +1,55 @@
+from datetime import datetime, timezone
+from typing import List
+from uuid import UUID, uuid4
+
+from app.domain.entities.auth_event import AuthEvent, AuthEventType
+from app.domain.interfaces.auth_event_repo import AuthEventRepository
+from app.infrastructure.audit.audit_log import QueuedAuditLog
+
+
+class InMemoryAuthEventRepository(AuthEventRepository):
+
+    def __init__(self):
+        self.batches: List[List[AuthEvent]] = []
+
+    async def save_many(self, events: List[AuthEvent]) -> None:
+        self.batches.append(list(events))
+
+    async def get_recent_by_user_id(self, user_id: UUID, limit: int) -> List[AuthEvent]:
+        events = [event for batch in self.batches for event in batch if event.user_id == user_id]
+        return sorted(events, key=lambda event: event.created_at, reverse=True)[:limit]
+
+
+def make_event() -> AuthEvent:
+    return AuthEvent(
+        id=uuid4(),
+        user_id=uuid4(),
+        event_type=AuthEventType.LOGIN,
+        created_at=datetime.now(timezone.utc),
+    )
+
+
+def test_record_drops_when_queue_is_full():
+    audit_log = QueuedAuditLog(max_size=2, batch_size=10, flush_interval=0.01)
+
+    for _ in range(3):
+        audit_log.record(make_event())
+
+    assert audit_log.queue_depth == 2
+    assert audit_log.dropped_events == 1
+
+
+async def test_stop_flushes_remaining_events_in_batches():
+    repository = InMemoryAuthEventRepository()
+    audit_log = QueuedAuditLog(max_size=100, batch_size=2, flush_interval=0.01)
+
+    audit_log.start(repository)
+
+    for _ in range(5):
+        audit_log.record(make_event())
+
+    await audit_log.stop()
+
+    assert audit_log.queue_depth == 0
+    assert audit_log.written_events == 5
+    assert all(len(batch) <= 2 for batch in repository.batches)
@@ -0,0 +1,143 @@
+from datetime import date
+
+import pytest
+
+from app.infrastructure.instruments.registry import InstrumentIndex, InstrumentRegistry
+
+
+ROWS = [
+    {
+        "instrument_token": 738561,
+        "exchange_token": 2885,
+        "tradingsymbol": "RELIANCE",
+        "name": "RELIANCE INDUSTRIES",
+        "exchange": "NSE",
+        "segment": "NSE",
+        "instrument_type": "EQ",
+        "expiry": "",
+        "strike": 0.0,
+        "tick_size": 0.05,
+        "lot_size": 1,
+    },
+    {
+        "instrument_token": 128083204,
+        "exchange_token": 500325,
+        "tradingsymbol": "RELIANCE",
+        "name": "RELIANCE INDUSTRIES",
+        "exchange": "BSE",
+        "segment": "BSE",
+        "instrument_type": "EQ",
+        "expiry": "",
+        "strike": 0.0,
+        "tick_size": 0.05,
+        "lot_size": 1,
+    },
+    {
+        "instrument_token": 13368834,
+        "exchange_token": 52222,
+        "tradingsymbol": "NIFTY24DECFUT",
+        "name": "NIFTY",
+        "exchange": "NFO",
+        "segment": "NFO-FUT",
+        "instrument_type": "FUT",
+        "expiry": date(2024, 12, 26),
+        "strike": 0.0,
+        "tick_size": 0.05,
+        "lot_size": 25,
+    },
+]
+
+
+def test_search_by_prefix_is_case_insensitive():
+    index = InstrumentIndex(ROWS)
+
+    results = index.search("reli")
+
+    assert [r.tradingsymbol for r in results] == ["RELIANCE", "RELIANCE"]
+    assert index.search("NIFTY")[0].expiry == date(2024, 12, 26)
+    assert index.search("TCS") == []
+
+
+def test_search_filters_by_exchange_and_limit():
+    index = InstrumentIndex(ROWS)
+
+    assert [r.exchange for r in index.search("REL", exchange="bse")] == ["BSE"]
+    assert index.search("REL", exchange="MCX") == []
+    assert len(index.search("REL", limit=1)) == 1
+
+
+def test_get_by_token():
+    registry = InstrumentRegistry(InstrumentIndex(ROWS))
+
+    instrument = registry.get_by_token(13368834)
+
+    assert instrument is not None
+    assert instrument.tradingsymbol == "NIFTY24DECFUT"
+    assert instrument.lot_size == 25
+    assert registry.get_by_token(1) is None
+
+
+def test_exchange_filter_skips_rows_from_other_exchanges():
+    options = [
+        {
+            "instrument_token": 1000 + i,
+            "tradingsymbol": f"BANKNIFTY24DEC{40000 + i}CE",
+            "name": "BANKNIFTY",
+            "exchange": "NFO",
+            "segment": "NFO-OPT",
+            "instrument_type": "CE",
+            "expiry": date(2024, 12, 26),
+            "strike": float(40000 + i),
+            "tick_size": 0.05,
+            "lot_size": 15,
+        }
+        for i in range(5000)
+    ]
+    bank = {
+        "instrument_token": 1,
+        "tradingsymbol": "BANKBARODA",
+        "name": "BANK OF BARODA",
+        "exchange": "BSE",
+        "segment": "BSE",
+        "instrument_type": "EQ",
+        "tick_size": 0.05,
+        "lot_size": 1,
+    }
+    index = InstrumentIndex(options + [bank])
+
+    results = index.search("BANK", exchange="BSE")
+
+    assert [r.tradingsymbol for r in results] == ["BANKBARODA"]
+    assert all(r.exchange == "NFO" for r in index.search("BANKNIFTY", exchange="NFO"))
+    assert len(index.search("BANK", limit=50)) == 50
+
+
+async def test_reload_swaps_in_new_snapshot(monkeypatch):
+    registry = InstrumentRegistry(InstrumentIndex(ROWS[:1]))
+    monkeypatch.setattr(registry, "_build_index", lambda: InstrumentIndex(ROWS))
+
+    await registry.reload()
+
+    assert registry.loaded_at is not None
+    assert len(registry.index) == 3
+    assert registry.get_by_token(13368834) is not None
+
+
+async def test_failed_reload_keeps_previous_snapshot(monkeypatch):
+    registry = InstrumentRegistry()
+    monkeypatch.setattr(registry, "_build_index", lambda: InstrumentIndex(ROWS))
+    await registry.reload()
+
+    previous_index = registry.index
+    previous_loaded_at = registry.loaded_at
+
+    def failing_build():
+        raise ConnectionError("instruments dump unavailable")
+
+    monkeypatch.setattr(registry, "_build_index", failing_build)
+
+    with pytest.raises(ConnectionError):
+        await registry.reload()
+
+    assert registry.index is previous_index
+    assert registry.loaded_at == previous_loaded_at